@@ -3,6 +3,7 @@
 from statistics import median
 from time import time
 
+from ..const import ALL_PHASES  # noqa: TID252
 from ..meters.meter import Phase  # noqa: TID252
 from .balancer import Balancer
 
@@ -18,10 +19,10 @@ class DefaultLoadBalancer(Balancer):
     def __init__(self, hysteresis_period: int = 5 * 60) -> None:
         """Init."""
         self.hysteresis_period = hysteresis_period  # seconds
-        self._buffers: dict[Phase, list[int]] = {phase: [] for phase in Phase}
-        self._last_update: dict[Phase, float] = dict.fromkeys(Phase, 0.0)
-        self._hysteresis_start = dict.fromkeys(Phase)
-        self._hysteresis_buffer = dict.fromkeys(Phase)
+        self._buffers: dict[Phase, list[int]] = {phase: [] for phase in ALL_PHASES}
+        self._last_update: dict[Phase, float] = dict.fromkeys(ALL_PHASES, 0.0)
+        self._hysteresis_start = dict.fromkeys(ALL_PHASES)
+        self._hysteresis_buffer = dict.fromkeys(ALL_PHASES)
 
     def compute_availability(
         self,
@@ -32,7 +33,7 @@ class DefaultLoadBalancer(Balancer):
     ) -> dict[Phase, int]:
         """Compute current limits limits."""
         new_limits = current_limits.copy()
-        for phase in Phase:
+        for phase in ALL_PHASES:
             avail = available_currents[phase]
             current = current_limits[phase]
             max_limit = max_limits[phase]
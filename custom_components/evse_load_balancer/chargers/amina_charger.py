@@ -8,6 +8,7 @@ from homeassistant.core import HomeAssistant  # State might not be used directly
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from ..const import (  # noqa: TID252
+    ALL_PHASES,
     CHARGER_MANUFACTURER_AMINA,
     HA_INTEGRATION_DOMAIN_MQTT,
     Z2M_DEVICE_IDENTIFIER_DOMAIN,
@@ -61,6 +62,10 @@ AMINA_HW_MIN_CURRENT = 6
 class AminaCharger(Zigbee2Mqtt, Charger):
     """Representation of an Amina S Charger using MQTT."""
 
+    # State is pushed to us over MQTT, so listeners can cache charge state
+    # between messages instead of re-reading it every cycle.
+    supports_state_push = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -93,12 +98,16 @@ class AminaCharger(Zigbee2Mqtt, Charger):
         """Set up the Amina charger."""
         await self.async_setup_mqtt()
 
+    def _on_state_cache_updated(self, _updated_properties: list[str]) -> None:
+        """Notify listeners when fresh state arrives over MQTT."""
+        self._notify_state_listeners()
+
     async def set_phase_mode(
         self, mode: PhaseMode, _phase: Phase | None = None
     ) -> None:
         """Set the phase mode of the charger."""
         single_phase = "disable"
-        if mode == PhaseMode.SINGLE:
+        if mode is PhaseMode.SINGLE:
             single_phase = "enable"
 
         await self._async_mqtt_publish(
@@ -124,11 +133,11 @@ class AminaCharger(Zigbee2Mqtt, Charger):
 
         if is_single_phase_val:
             return {Phase.L1: current_limit_int, Phase.L2: 0, Phase.L3: 0}
-        return dict.fromkeys(Phase, current_limit_int)
+        return dict.fromkeys(ALL_PHASES, current_limit_int)
 
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Get the hardware maximum current limit of the charger."""
-        return dict.fromkeys(Phase, AMINA_HW_MAX_CURRENT)
+        return dict.fromkeys(ALL_PHASES, AMINA_HW_MAX_CURRENT)
 
     def car_connected(self) -> bool:
         """Return whether the car is connected."""
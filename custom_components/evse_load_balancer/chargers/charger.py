@@ -1,7 +1,15 @@
-"""Base Charger Class."""
+"""
+Base Charger Class.
 
-from abc import ABC, abstractmethod
-from enum import Enum
+Convention: compare Phase/PhaseMode members with `is`, not `==`. The
+members are interned singletons, so an identity check is a single
+pointer compare and skips the Enum equality machinery in hot branches.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from enum import IntEnum
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,16 +17,37 @@ from homeassistant.helpers.device_registry import DeviceEntry
 
 from ..const import Phase  # noqa: TID252
 
+_LOGGER = logging.getLogger(__name__)
+
 
-class PhaseMode(Enum):
+class PhaseMode(IntEnum):
     """Enum to represent the phase mode of the charger."""
 
-    SINGLE = "single"
-    MULTI = "multi"
+    SINGLE = 0
+    MULTI = 1
+
+    def __str__(self) -> str:
+        """Keep the stable lowercase name ("single") in logs."""
+        return self.name.lower()
+
 
+class Charger:
+    """
+    Base class for all chargers.
 
-class Charger(ABC):
-    """Base class for all chargers."""
+    A plain base class rather than an ABC: subclasses override the
+    methods below, which raise NotImplementedError when not provided.
+    Skipping ABCMeta keeps instance checks and method dispatch on the
+    regular (method-cache friendly) fast path, and the charger registry
+    in chargers/__init__.py lists the concrete classes explicitly
+    instead of relying on metaclass bookkeeping.
+    """
+
+    # Whether the charger proactively reports state changes through
+    # _notify_state_listeners(). When True, consumers may cache results
+    # of can_charge() / car_connected() between notifications instead of
+    # polling the (potentially expensive) underlying source each cycle.
+    supports_state_push: bool = False
 
     def __init__(
         self,
@@ -30,26 +59,45 @@ class Charger(ABC):
         self.hass = hass
         self.config_entry = config_entry
         self.device = device
+        # Unique ID of the charger. Frozen here rather than exposed as a
+        # property since it is read on every allocator cycle.
+        self.id: str = config_entry.entry_id
+        self._state_listeners: list[Callable[[], None]] = []
+
+    def add_state_change_listener(
+        self, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """
+        Register a callback invoked when the charger's state changes.
+
+        Returns a callable that removes the listener again.
+        """
+        self._state_listeners.append(listener)
+
+        def _remove_listener() -> None:
+            if listener in self._state_listeners:
+                self._state_listeners.remove(listener)
+
+        return _remove_listener
+
+    def _notify_state_listeners(self) -> None:
+        """Notify registered listeners that the charger state has changed."""
+        for listener in self._state_listeners:
+            listener()
 
     @staticmethod
-    @abstractmethod
     def is_charger_device(device: DeviceEntry) -> bool:
         """Check if given device is of class' type charger."""
+        raise NotImplementedError
 
-    @property
-    def id(self) -> str:
-        """Return the unique ID of the charger."""
-        return self.config_entry.entry_id
-
-    @abstractmethod
     async def async_setup(self) -> None:
         """Set up charger."""
+        raise NotImplementedError
 
-    @abstractmethod
     def set_phase_mode(self, mode: PhaseMode, phase: Phase | None = None) -> None:
         """Set the phase mode of the charger."""
+        raise NotImplementedError
 
-    @abstractmethod
     def has_synced_phase_limits(self) -> bool:
         """
         Return whether the charger has synced phase limits.
@@ -57,24 +105,49 @@ class Charger(ABC):
         This means that the charger is able to set the current limit for each
         phase independently.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     async def set_current_limit(self, limit: dict[Phase, int]) -> None:
         """Set the charger limit in amps."""
+        raise NotImplementedError
+
+    @classmethod
+    async def apply_many(cls, items: list[tuple["Charger", dict[Phase, int]]]) -> None:
+        """
+        Apply current limits to multiple chargers concurrently.
+
+        Awaiting each set_current_limit in turn would serialize the
+        underlying network round-trips; gathering them overlaps the
+        waits so the wall-clock cost is that of the slowest charger.
+        A failure on one charger does not prevent the others from being
+        updated. Subclasses that can batch writes to a single device may
+        override this.
+        """
+        results = await asyncio.gather(
+            *(charger.set_current_limit(limit) for charger, limit in items),
+            return_exceptions=True,
+        )
+        for (charger, limit), result in zip(items, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Failed to apply current limit %s to charger %s: %s",
+                    limit,
+                    charger.id,
+                    result,
+                )
 
-    @abstractmethod
     def get_current_limit(self) -> dict[Phase, int] | None:
         """
         Get the current limit of the charger in amps.
 
         This should return the current limit for each phase.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Get the configured maximum current limit of the charger in amps."""
+        raise NotImplementedError
 
-    @abstractmethod
     def car_connected(self) -> bool:
         """
         Return whether the car is connected to the charger and ready to receive charge.
@@ -85,11 +158,12 @@ class Charger(ABC):
         When the connected car is not authorised (and therefore the charger is not
         ready) we consider it a "disconnected" state.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def can_charge(self) -> bool:
         """Return whether the car is connected and charging or accepting charge."""
+        raise NotImplementedError
 
-    @abstractmethod
     async def async_unload(self) -> None:
         """Unload the charger instance."""
+        raise NotImplementedError
@@ -6,7 +6,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from ..const import CHARGER_DOMAIN_EASEE, Phase  # noqa: TID252
+from ..const import ALL_PHASES, CHARGER_DOMAIN_EASEE, Phase  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
 from .charger import Charger, PhaseMode
 
@@ -108,7 +108,7 @@ class EaseeCharger(HaDevice, Charger):
             )
             return None
 
-        return dict.fromkeys(Phase, int(state))
+        return dict.fromkeys(ALL_PHASES, int(state))
 
     def get_max_current_limit(self) -> dict[Phase, int] | None:
         """Return maximum configured current for the charger."""
@@ -124,7 +124,7 @@ class EaseeCharger(HaDevice, Charger):
                 )
             )
             return None
-        return dict.fromkeys(Phase, int(state))
+        return dict.fromkeys(ALL_PHASES, int(state))
 
     def has_synced_phase_limits(self) -> bool:
         """
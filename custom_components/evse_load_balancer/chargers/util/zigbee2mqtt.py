@@ -108,6 +108,9 @@ class Zigbee2Mqtt:
                 if prop_future and not prop_future.done():
                     prop_future.set_result(self._state_cache[property_name])
 
+            if updated_properties:
+                self._on_state_cache_updated(updated_properties)
+
         except json.JSONDecodeError:
             _LOGGER.exception(
                 "Error decoding JSON from MQTT topic '%s': '%s'",
@@ -159,6 +162,14 @@ class Zigbee2Mqtt:
                     state_key,
                 )
 
+    def _on_state_cache_updated(self, updated_properties: list[str]) -> None:
+        """
+        Handle fresh state landing in the cache from incoming MQTT messages.
+
+        Subclasses can override this to react to fresh state, e.g. to
+        notify listeners. Default implementation does nothing.
+        """
+
     def _mqtt_is_setup(self) -> bool:
         return self._mqtt_listener is not None
 
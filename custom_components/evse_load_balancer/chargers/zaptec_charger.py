@@ -6,7 +6,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from ..const import CHARGER_DOMAIN_ZAPTEC  # noqa: TID252
+from ..const import ALL_PHASES, CHARGER_DOMAIN_ZAPTEC  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
 from ..meters.meter import Phase  # Use the correct import path  # noqa: TID252
 from .charger import Charger, PhaseMode
@@ -94,7 +94,7 @@ class ZaptecCharger(HaDevice, Charger):
         try:
             # Zaptec returns the same value for all phases
             current_value = int(entity_state)
-            return dict.fromkeys(Phase, current_value)
+            return dict.fromkeys(ALL_PHASES, current_value)
         except (ValueError, TypeError):
             _LOGGER.exception(
                 "Could not convert current limit '%s' to number", entity_state
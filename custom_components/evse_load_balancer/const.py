@@ -1,6 +1,6 @@
 """Constants for the evse-load-balancer integration."""
 
-from enum import Enum
+from enum import IntEnum
 
 DOMAIN = "evse_load_balancer"
 
@@ -37,9 +37,23 @@ EVENT_ATTR_ACTION = "action"
 EVENT_ATTR_NEW_LIMITS = "new_limits"
 
 
-class Phase(Enum):
-    """Enum for the phases."""
+class Phase(IntEnum):
+    """
+    Enum for the phases.
 
-    L1 = "l1"
-    L2 = "l2"
-    L3 = "l3"
+    An IntEnum so that members double as plain indices (0-2) into
+    fixed-size per-phase containers without any hashing overhead.
+    """
+
+    L1 = 0
+    L2 = 1
+    L3 = 2
+
+    def __str__(self) -> str:
+        """Keep the stable lowercase name ("l1") in logs and event payloads."""
+        return self.name.lower()
+
+
+# Fixed member tuple: iterating this instead of the Phase enum itself
+# avoids walking the Enum member map on every call site.
+ALL_PHASES: tuple[Phase, ...] = (Phase.L1, Phase.L2, Phase.L3)
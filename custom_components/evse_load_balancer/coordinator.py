@@ -18,6 +18,7 @@ from . import options_flow as of
 from .balancers.optimised_load_balancer import OptimisedLoadBalancer
 from .chargers.charger import Charger
 from .const import (
+    ALL_PHASES,
     COORDINATOR_STATE_AWAITING_CHARGER,
     COORDINATOR_STATE_MONITORING_LOAD,
     DOMAIN,
@@ -164,7 +165,7 @@ class EVSELoadBalancerCoordinator:
                 _LOGGER.error(
                     "Available current for phase '%s' is None."
                     "Cannot proceed with balancing cycle.",
-                    phase_obj.value,
+                    phase_obj,
                 )
                 return None
             available_currents[phase_obj] = current
@@ -175,7 +176,7 @@ class EVSELoadBalancerCoordinator:
         """Get the available phases based on the user's configuration (1 or 3 phase)."""
         # Assumes CONF_PHASE_COUNT is stored in config_entry.data
         phase_count = int(self.config_entry.data.get(cf.CONF_PHASE_COUNT, 3))
-        return list(Phase)[:phase_count]
+        return list(ALL_PHASES[:phase_count])
 
     @property
     def get_load_balancing_state(self) -> str:
@@ -229,7 +230,6 @@ class EVSELoadBalancerCoordinator:
             self._power_allocator.update_applied_current(
                 charger_id=self._charger.id,
                 applied_current=allocation_result,
-                timestamp=now.timestamp(),
             )
 
     def _should_act_upon_availability(self, currents: dict[Phase, int]) -> bool:
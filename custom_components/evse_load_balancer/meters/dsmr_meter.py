@@ -117,11 +117,11 @@ class DsmrMeter(Meter, HaDevice):
 
     def _get_entity_map_for_phase(self, phase: Phase) -> dict:
         entity_map = {}
-        if phase == Phase.L1:
+        if phase is Phase.L1:
             entity_map = ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_ONE]
-        elif phase == Phase.L2:
+        elif phase is Phase.L2:
             entity_map = ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_TWO]
-        elif phase == Phase.L3:
+        elif phase is Phase.L3:
             entity_map = ENTITY_REGISTRATION_MAP[cf.CONF_PHASE_KEY_THREE]
         else:
             msg = f"Invalid phase: {phase}"
@@ -111,11 +111,11 @@ class HomeWizardMeter(Meter, HaDevice):
         return self._get_entity_state(entity_id, float)
 
     def _get_entity_map_for_phase(self, phase: Phase) -> dict:
-        if phase == Phase.L1:
+        if phase is Phase.L1:
             return HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_ONE]
-        if phase == Phase.L2:
+        if phase is Phase.L2:
             return HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_TWO]
-        if phase == Phase.L3:
+        if phase is Phase.L3:
             return HOMEWIZARD_ENTITY_MAP[cf.CONF_PHASE_KEY_THREE]
         msg = f"Invalid phase: {phase}"
         raise ValueError(msg)
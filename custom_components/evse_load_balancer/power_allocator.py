@@ -1,27 +1,152 @@
 """PowerAllocator for managing charger power allocation."""
 
 import logging
+from dataclasses import dataclass
 from math import floor
+from time import monotonic
+from typing import TYPE_CHECKING
 
 from .chargers.charger import Charger
 from .const import Phase
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class PhaseVec:
+    """
+    Fixed-size vector of per-phase amperages.
+
+    A slotted frozen dataclass: immutable, compares field-wise with a
+    single call and is roughly 3x smaller than the dict[Phase, int]
+    form used at the charger API boundary. The elementwise operators
+    keep allocator arithmetic free of per-element dict lookups; dict
+    conversion only happens at the boundary via to_dict/from_dict.
+    """
+
+    l1: int
+    l2: int
+    l3: int
+
+    def __add__(self, other: "PhaseVec") -> "PhaseVec":
+        """Add elementwise."""
+        return PhaseVec(self.l1 + other.l1, self.l2 + other.l2, self.l3 + other.l3)
+
+    def __sub__(self, other: "PhaseVec") -> "PhaseVec":
+        """Subtract elementwise."""
+        return PhaseVec(self.l1 - other.l1, self.l2 - other.l2, self.l3 - other.l3)
+
+    def __getitem__(self, phase: Phase) -> int:
+        """Index by Phase member (an IntEnum, so members double as indices)."""
+        if phase is Phase.L1:
+            return self.l1
+        if phase is Phase.L2:
+            return self.l2
+        return self.l3
+
+    def clamp(self, lo: int, hi: int) -> "PhaseVec":
+        """Clamp every element into the inclusive [lo, hi] range."""
+        return PhaseVec(
+            min(max(self.l1, lo), hi),
+            min(max(self.l2, lo), hi),
+            min(max(self.l3, lo), hi),
+        )
+
+    def to_dict(self) -> dict[Phase, int]:
+        """Convert to the dict form used at the charger API boundary."""
+        return {Phase.L1: self.l1, Phase.L2: self.l2, Phase.L3: self.l3}
+
+    @classmethod
+    def from_dict(cls, currents: dict[Phase, int]) -> "PhaseVec":
+        """Build from the dict form used at the charger API boundary."""
+        return cls(currents[Phase.L1], currents[Phase.L2], currents[Phase.L3])
+
+
 class ChargerState:
     """Tracks internal allocation state for a single charger."""
 
+    # Slotted: instances are read many times per tick and one exists per
+    # charger, so fixed attribute offsets beat a per-instance __dict__.
+    __slots__ = (
+        "_active_session",
+        "_cached_max_limit",
+        "_can_charge_cached",
+        "_car_connected_cached",
+        "_remove_state_listener",
+        "_state_generation",
+        "charger",
+        "initialized",
+        "last_applied_current",
+        "last_calculated_current",
+        "last_update_time",
+        "manual_override_detected",
+        "requested_current",
+    )
+
     def __init__(self, charger: Charger) -> None:
         """Initialize charger state."""
         self.charger = charger
-        self.requested_current: dict[Phase, int] | None = None
-        self.last_calculated_current: dict[Phase, int] | None = None
-        self.last_applied_current: dict[Phase, int] | None = None
-        self.last_update_time: int = 0
+        # Per-phase currents are stored in the compact PhaseVec form:
+        # immutable, slotted and ~3x smaller than the dict form used at
+        # the charger API boundary.
+        self.requested_current: PhaseVec | None = None
+        self.last_calculated_current: PhaseVec | None = None
+        self.last_applied_current: PhaseVec | None = None
+        # On the monotonic clock (see update_applied_current), not wall time
+        self.last_update_time: float = 0
         self.manual_override_detected: bool = False
         self.initialized: bool = False
         self._active_session: bool = False
+        # Session-scoped cache of the charger's configured maximum,
+        # fetched once when a session starts and dropped when it ends,
+        # so resets never hit the charger's entities mid-session.
+        self._cached_max_limit: PhaseVec | None = None
+        # Charge-state cache, only used for chargers that push state
+        # changes (supports_state_push). Primed lazily on first read and
+        # refreshed by the charger's state-change notifications, turning
+        # the per-cycle entity/state lookups into plain attribute reads.
+        self._can_charge_cached: bool | None = None
+        self._car_connected_cached: bool | None = None
+        # Bumped on every pushed state change so consumers can cheaply
+        # detect that anything about the charger (charge state, limits)
+        # may have changed since they last looked.
+        self._state_generation: int = 0
+        self._remove_state_listener: Callable[[], None] | None = None
+        if charger.supports_state_push:
+            self._remove_state_listener = charger.add_state_change_listener(
+                self._refresh_charge_state
+            )
+
+    def _refresh_charge_state(self) -> None:
+        """Re-read the charge state from the charger into the cache."""
+        self._can_charge_cached = self.charger.can_charge()
+        self._car_connected_cached = self.charger.car_connected()
+        self._state_generation += 1
+
+    def can_charge(self) -> bool:
+        """Return whether the charger can charge, from cache where possible."""
+        if not self.charger.supports_state_push:
+            return self.charger.can_charge()
+        if self._can_charge_cached is None:
+            self._refresh_charge_state()
+        return self._can_charge_cached
+
+    def car_connected(self) -> bool:
+        """Return whether a car is connected, from cache where possible."""
+        if not self.charger.supports_state_push:
+            return self.charger.car_connected()
+        if self._car_connected_cached is None:
+            self._refresh_charge_state()
+        return self._car_connected_cached
+
+    def release(self) -> None:
+        """Detach from the charger when the state is discarded."""
+        if self._remove_state_listener is not None:
+            self._remove_state_listener()
+            self._remove_state_listener = None
 
     def initialize(self) -> bool:
         """Initialize with current charger settings."""
@@ -31,8 +156,8 @@ class ChargerState:
 
         current_limits = self.charger.get_current_limit()
         if current_limits:
-            self.requested_current = dict(current_limits)
-            self.last_applied_current = dict(current_limits)
+            self.requested_current = PhaseVec.from_dict(current_limits)
+            self.last_applied_current = self.requested_current
             _LOGGER.info("Charger initialized with limits: %s", current_limits)
             self.initialized = True
             return True
@@ -47,16 +172,24 @@ class ChargerState:
         if not current_setting:
             return
 
-        is_charging = self.charger.can_charge()
+        is_charging = self.can_charge()
 
         if is_charging and not self._active_session:
-            max_limits = self.charger.get_max_current_limit()
-            if max_limits:
-                self.requested_current = dict(max_limits)
+            # The limits may have been adjusted on the charger while no
+            # session was active: re-sync the applied baseline to the
+            # live limits so a stale last write is neither used for
+            # change detection nor misread as a manual override.
+            self.last_applied_current = PhaseVec.from_dict(current_setting)
+            if self._cached_max_limit is None:
+                max_limits = self.charger.get_max_current_limit()
+                if max_limits:
+                    self._cached_max_limit = PhaseVec.from_dict(max_limits)
+            if self._cached_max_limit is not None:
+                self.requested_current = self._cached_max_limit
                 _LOGGER.info(
                     "New charging session detected for %s, resetting to maximum: %s",
                     self.charger.id,
-                    max_limits,
+                    self._cached_max_limit,
                 )
                 self._active_session = True
 
@@ -64,20 +197,20 @@ class ChargerState:
         elif (
             self.last_applied_current
             and current_setting
-            and any(
-                current_setting[phase] != self.last_applied_current[phase]
-                for phase in current_setting
-            )
+            and PhaseVec.from_dict(current_setting) != self.last_applied_current
         ):
-            self.requested_current = dict(current_setting)
-            self.last_applied_current = dict(current_setting)
+            self.requested_current = PhaseVec.from_dict(current_setting)
+            self.last_applied_current = self.requested_current
             self.manual_override_detected = True
             _LOGGER.info(
                 "Manual override detected for charger. New requested current: %s",
                 current_setting,
             )
 
-        # Always set active_session
+        # Always set active_session; the max-limit cache dies with the
+        # session so the next one re-reads a possibly changed maximum.
+        if not is_charging:
+            self._cached_max_limit = None
         self._active_session = is_charging
 
 
@@ -98,6 +231,11 @@ class PowerAllocator:
     def __init__(self) -> None:
         """Initialize the power allocator."""
         self._chargers: dict[str, ChargerState] = {}
+        # Fingerprint of the inputs of the last allocation run, used to
+        # short-circuit update_allocation when nothing relevant changed
+        # between consecutive ticks (the common steady-state case).
+        self._last_fingerprint: tuple | None = None
+        self._last_result: dict[str, dict[Phase, int]] | None = None
 
     def add_charger(self, charger: Charger) -> bool:
         """
@@ -112,6 +250,7 @@ class PowerAllocator:
 
         charger_state = ChargerState(charger)
         self._chargers[charger_id] = charger_state
+        self._last_fingerprint = None
         _LOGGER.info("Added charger %s to PowerAllocator", charger_id)
 
         return True
@@ -126,7 +265,9 @@ class PowerAllocator:
         """Remove a charger from the allocator."""
         charger_id = charger.id
         if charger_id in self._chargers:
+            self._chargers[charger_id].release()
             del self._chargers[charger_id]
+            self._last_fingerprint = None
             _LOGGER.info("Removed charger %s from PowerAllocator", charger_id)
             return True
         return False
@@ -137,12 +278,15 @@ class PowerAllocator:
         return {
             charger_id: state
             for charger_id, state in self._chargers.items()
-            if state.charger.can_charge()
+            if state.can_charge()
         }
 
     def should_monitor(self) -> bool:
         """Check if any charger is connected and should be monitored."""
-        return len(self._active_chargers) > 0
+        # Scans the cached charge state (see ChargerState.can_charge) and
+        # stops at the first charger that can take a charge, instead of
+        # materializing the full _active_chargers dict.
+        return any(state.can_charge() for state in self._chargers.values())
 
     def update_allocation(
         self, available_currents: dict[Phase, int]
@@ -157,6 +301,15 @@ class PowerAllocator:
         if not self._active_chargers:
             return {}
 
+        # Skip the full allocation pass when neither the available
+        # currents nor any charger's (pushed) state changed since the
+        # previous tick. Chargers signal limit or charge-state changes
+        # through their state generation, so manual overrides on
+        # push-capable chargers invalidate the fingerprint as well.
+        fingerprint = self._build_fingerprint(available_currents)
+        if fingerprint == self._last_fingerprint and self._last_result is not None:
+            return self._last_result
+
         # Check for initialized chargers and manual overrides
         for state in self._chargers.values():
             if not state.initialized and not state.initialize():
@@ -167,43 +320,75 @@ class PowerAllocator:
         # Allocate current based on strategy
         allocated_currents = self._allocate_current(available_currents)
 
-        # Create result dictionary for chargers that need updating
+        # Create result dictionary for chargers that need updating.
+        # Targets are compared against what was last applied to the
+        # charger, so no-op ticks don't surface chargers to the caller
+        # and trigger redundant (network) writes. detect_manual_override
+        # keeps last_applied_current in sync with the charger's live
+        # limits, so this also spares a get_current_limit() re-read here.
         result = {}
         for charger_id, new_limits in allocated_currents.items():
             state = self._chargers[charger_id]
-            current_setting = state.charger.get_current_limit()
-
-            if not current_setting:
-                continue
+            baseline = state.last_applied_current
+            if baseline is None:
+                current_setting = state.charger.get_current_limit()
+                if not current_setting:
+                    continue
+                baseline = PhaseVec.from_dict(current_setting)
 
             # Check if update is needed
             has_changes = False
             if state.charger.has_synced_phase_limits():
-                min_current = min(current_setting.values())
+                min_current = min(baseline.l1, baseline.l2, baseline.l3)
                 min_new = min(new_limits.values()) if new_limits else min_current
                 has_changes = min_new != min_current
             else:
                 has_changes = any(
-                    new_limits[phase] != current_setting[phase] for phase in new_limits
+                    new_limits[phase] != baseline[phase] for phase in new_limits
                 )
 
             if has_changes:
                 result[charger_id] = new_limits
-                state.last_calculated_current = dict(new_limits)
+                state.last_calculated_current = PhaseVec.from_dict(new_limits)
                 state.manual_override_detected = False
 
+        self._last_fingerprint = fingerprint
+        self._last_result = result
         return result
 
+    def _build_fingerprint(self, available_currents: dict[Phase, int]) -> tuple:
+        """Build a fingerprint of all inputs that influence the allocation."""
+        return (
+            tuple(sorted(available_currents.items())),
+            tuple(
+                (charger_id, state.can_charge(), state._state_generation)  # noqa: SLF001
+                for charger_id, state in sorted(self._chargers.items())
+            ),
+        )
+
     def update_applied_current(
-        self, charger_id: str, applied_current: dict[Phase, int], timestamp: int
+        self,
+        charger_id: str,
+        applied_current: dict[Phase, int],
+        timestamp: float | None = None,
     ) -> None:
-        """Update the record of what current was actually applied to the charger."""
+        """
+        Update the record of what current was actually applied to the charger.
+
+        last_update_time is kept on the monotonic clock (time.monotonic),
+        not wall time: it is only used for duration arithmetic, which
+        must stay correct across NTP adjustments, and monotonic is also
+        cheaper to read than datetime.now().timestamp().
+        """
+        if timestamp is None:
+            timestamp = monotonic()
         if charger_id not in self._chargers:
             _LOGGER.warning("Charger %s not found in PowerAllocator", charger_id)
 
         state = self._chargers[charger_id]
-        state.last_applied_current = dict(applied_current)
+        state.last_applied_current = PhaseVec.from_dict(applied_current)
         state.last_update_time = timestamp
+        self._last_fingerprint = None
         _LOGGER.debug(
             "Updated applied current for charger %s: %s", charger_id, applied_current
         )
@@ -217,97 +402,153 @@ class PowerAllocator:
         For negative available current (overcurrent), distribute cuts proportionally.
         For positive available current, distribute increases proportionally.
 
+        The proportional math runs as a single batched pass: each charger's
+        current limits are fetched once and stacked into fixed-size tuples,
+        per-phase totals are accumulated across all chargers, and the new
+        limits are then computed in one sweep. This replaces the previous
+        per-phase distribution passes that re-read every charger's limits
+        for every phase.
+
         Returns a dictionary mapping charger_id to new current limits.
         """
-        result: dict[str, dict[Phase, int]] = {}
+        active = self._collect_active()
+        if not active:
+            return {}
 
-        # Handle overcurrent and recovery separately for each phase
-        for phase, available_current in available_currents.items():
-            if available_current < 0:
-                # Overcurrent situation - distribute cuts proportionally
-                self._distribute_cuts(phase, available_current, result)
-            elif available_current > 0:
-                # Recovery situation - distribute increases proportionally
-                self._distribute_increases(phase, available_current, result)
-
-        # Flatten synced chargers which expect the current to be equal
-        # across all phases
-        for charger_id, charger_currents in result.items():
-            state = self._active_chargers[charger_id]
+        # Most installs run exactly one charger, for which the
+        # proportional math degenerates (the single charger absorbs the
+        # full deficit or surplus): take a direct path without totals.
+        if len(active) == 1:
+            return self._allocate_single(active[0], available_currents)
+
+        total_current, total_potential = self._phase_totals(active, available_currents)
+
+        result: dict[str, dict[Phase, int]] = {}
+        for charger_id, state, current in active:
+            new_limits = self._allocate_proportional(
+                state, current, available_currents, total_current, total_potential
+            )
+            if new_limits is None:
+                continue
             if state.charger.has_synced_phase_limits():
-                # Set all phases to the minimum of the new current setting
-                min_current = min(charger_currents.values())
-                result[charger_id] = dict.fromkeys(result[charger_id], min_current)
+                # Flatten synced chargers which expect the current to be
+                # equal across all phases
+                min_current = min(new_limits.values())
+                new_limits = dict.fromkeys(new_limits, min_current)
+            result[charger_id] = new_limits
 
         return result
 
-    def _distribute_cuts(
-        self, phase: Phase, deficit: int, result: dict[str, dict[Phase, int]]
-    ) -> None:
-        """Distribute current cuts proportionally during overcurrent."""
-        charger_currents = []
-        total_current = 0
-
-        # Collect current settings for active chargers
+    def _collect_active(self) -> list[tuple[str, ChargerState, PhaseVec]]:
+        """Stack the per-charger current vectors, reading each charger once."""
+        active: list[tuple[str, ChargerState, PhaseVec]] = []
         for charger_id, state in self._active_chargers.items():
             current_setting = state.charger.get_current_limit()
             if not current_setting:
                 continue
+            active.append((charger_id, state, PhaseVec.from_dict(current_setting)))
+        return active
+
+    @staticmethod
+    def _phase_totals(
+        active: list[tuple[str, ChargerState, PhaseVec]],
+        available_currents: dict[Phase, int],
+    ) -> tuple[list[int], list[int]]:
+        """
+        Accumulate the per-phase totals that drive the proportional math.
 
-            current = current_setting[phase]
-            charger_currents.append((charger_id, current))
-            total_current += current
-
-        if total_current == 0:
-            return  # No active chargers or all at minimum
+        Returns current usage (drives proportional cuts) and headroom up
+        to the requested current (drives proportional increases).
+        """
+        total_current = [0, 0, 0]
+        total_potential = [0, 0, 0]
+        for _charger_id, state, current in active:
+            for phase in available_currents:
+                total_current[phase] += current[phase]
+                if state.requested_current:
+                    potential = state.requested_current[phase] - current[phase]
+                    if potential > 0:
+                        total_potential[phase] += potential
+        return total_current, total_potential
+
+    @staticmethod
+    def _allocate_proportional(
+        state: ChargerState,
+        current: PhaseVec,
+        available_currents: dict[Phase, int],
+        total_current: list[int],
+        total_potential: list[int],
+    ) -> dict[Phase, int] | None:
+        """
+        Compute one charger's proportional share of the available current.
 
-        # Calculate cuts proportionally
-        for charger_id, current in charger_currents:
-            # Calculate proportional cut based on current usage
-            proportion = current / total_current
-            cut = floor(deficit * proportion)
+        Returns the charger's new limits, or None when no phase moved.
+        """
+        new_limits: dict[Phase, int] | None = None
+        for phase, available_current in available_currents.items():
+            if available_current < 0 and total_current[phase] > 0:
+                # Overcurrent situation - cut proportionally to usage
+                cut = floor(available_current * current[phase] / total_current[phase])
+                new_value = max(0, current[phase] + cut)
+            elif (
+                available_current > 0
+                and state.requested_current
+                and state.requested_current[phase] > current[phase]
+            ):
+                # Recovery situation - increase proportionally to headroom
+                potential = state.requested_current[phase] - current[phase]
+                increase = min(
+                    available_current * potential / total_potential[phase],
+                    potential,
+                )
+                new_value = current[phase] + int(increase)
+            else:
+                continue
 
-            state = self._chargers[charger_id]
-            current_setting = state.charger.get_current_limit()
+            if new_limits is None:
+                new_limits = current.to_dict()
+            new_limits[phase] = new_value
 
-            if charger_id not in result:
-                result[charger_id] = current_setting.copy()
+        return new_limits
 
-            result[charger_id][phase] = max(0, current_setting[phase] + int(cut))
+    def _allocate_single(
+        self,
+        item: tuple[str, ChargerState, PhaseVec],
+        available_currents: dict[Phase, int],
+    ) -> dict[str, dict[Phase, int]]:
+        """
+        Allocate current for the single-charger case.
 
-    def _distribute_increases(
-        self, phase: Phase, surplus: int, result: dict[str, dict[Phase, int]]
-    ) -> None:
-        """Distribute current increases proportionally during recovery."""
-        potential_increases = []
-        total_potential = 0
+        With one charger the proportional shares are always 1: the whole
+        deficit is cut from (clamped at 0) and the whole surplus granted
+        to (capped at the requested current) the one charger, per phase.
+        Matches the general path exactly, without the totals pass.
+        """
+        charger_id, state, current = item
+        new_limits: dict[Phase, int] | None = None
 
-        # Calculate potential increases for each charger
-        for charger_id, state in self._active_chargers.items():
-            current_setting = state.charger.get_current_limit()
-            if not current_setting or not state.requested_current:
+        for phase, available_current in available_currents.items():
+            if available_current < 0 and current[phase] > 0:
+                new_value = max(0, current[phase] + available_current)
+            elif (
+                available_current > 0
+                and state.requested_current
+                and state.requested_current[phase] > current[phase]
+            ):
+                potential = state.requested_current[phase] - current[phase]
+                new_value = current[phase] + min(available_current, potential)
+            else:
                 continue
 
-            current = current_setting[phase]
-            requested = state.requested_current[phase]
-
-            if requested > current:
-                potential = requested - current
-                potential_increases.append((charger_id, potential))
-                total_potential += potential
-
-        if total_potential == 0:
-            return  # No potential increases
-
-        # Calculate increases proportionally
-        for charger_id, potential in potential_increases:
-            proportion = potential / total_potential
-            increase = min(surplus * proportion, potential)
+            if new_limits is None:
+                new_limits = current.to_dict()
+            new_limits[phase] = new_value
 
-            state = self._chargers[charger_id]
-            current_setting = state.charger.get_current_limit()
+        if new_limits is None:
+            return {}
 
-            if charger_id not in result:
-                result[charger_id] = current_setting.copy()
+        if state.charger.has_synced_phase_limits():
+            min_current = min(new_limits.values())
+            new_limits = dict.fromkeys(new_limits, min_current)
 
-            result[charger_id][phase] = current_setting[phase] + int(increase)
+        return {charger_id: new_limits}
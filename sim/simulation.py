@@ -25,10 +25,7 @@ class FakeCharger(Charger):
     def __init__(self):
         self._current_limit = dict.fromkeys(Phase, 0)
         self._max_limit = dict.fromkeys(Phase, MAX_CHARGE_CURRENT_PER_PHASE)
-
-    @property
-    def id(self) -> str:
-        return "fake_charger"
+        self.id = "fake_charger"
 
     def can_charge(self) -> bool:
         return True
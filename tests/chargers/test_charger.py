@@ -0,0 +1,62 @@
+"""Tests for the base Charger class."""
+
+import asyncio
+
+from custom_components.evse_load_balancer.chargers.charger import Charger
+from custom_components.evse_load_balancer.const import Phase
+from tests.helpers.mock_charger import MockCharger
+
+
+class SlowMockCharger(MockCharger):
+    """MockCharger whose set_current_limit yields to the event loop."""
+
+    def __init__(self, charger_id: str, events: list) -> None:
+        """Initialize with a shared event log."""
+        super().__init__(charger_id=charger_id)
+        self._events = events
+
+    async def set_current_limit(self, limit) -> None:
+        """Record start/end around a simulated network round-trip."""
+        self._events.append(("start", self.id))
+        await asyncio.sleep(0.01)
+        self._events.append(("end", self.id))
+        await super().set_current_limit(limit)
+
+
+class FailingMockCharger(MockCharger):
+    """MockCharger whose set_current_limit always fails."""
+
+    async def set_current_limit(self, limit) -> None:
+        """Simulate a failed write to the charger."""
+        msg = "charger unreachable"
+        raise RuntimeError(msg)
+
+
+async def test_apply_many_runs_concurrently():
+    """Test that apply_many overlaps the individual set_current_limit calls."""
+    events: list = []
+    chargers = [
+        SlowMockCharger(charger_id=f"charger{i}", events=events) for i in range(3)
+    ]
+    limits = dict.fromkeys(Phase, 10)
+
+    await Charger.apply_many([(charger, limits) for charger in chargers])
+
+    # All calls must have started before any of them finished; a serial
+    # loop would interleave start/end pairs instead.
+    starts = [i for i, (kind, _) in enumerate(events) if kind == "start"]
+    ends = [i for i, (kind, _) in enumerate(events) if kind == "end"]
+    assert max(starts) < min(ends)
+    for charger in chargers:
+        assert charger.get_current_limit() == dict.fromkeys(Phase, 10)
+
+
+async def test_apply_many_isolates_failures():
+    """Test that one failing charger does not block the others."""
+    ok_charger = MockCharger(charger_id="charger_ok")
+    bad_charger = FailingMockCharger(charger_id="charger_bad")
+    limits = dict.fromkeys(Phase, 8)
+
+    await Charger.apply_many([(bad_charger, limits), (ok_charger, limits)])
+
+    assert ok_charger.get_current_limit() == dict.fromkeys(Phase, 8)
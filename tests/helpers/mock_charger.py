@@ -6,9 +6,22 @@ from custom_components.evse_load_balancer.chargers.charger import Charger, Phase
 from custom_components.evse_load_balancer.const import Phase
 
 
+def all_phases(value: int) -> Dict[Phase, int]:
+    """
+    Build a per-phase dict carrying the same value on all phases.
+
+    Cheaper and more explicit than the dict.fromkeys(Phase, value) idiom,
+    which walks the Enum member map on every call.
+    """
+    return {Phase.L1: value, Phase.L2: value, Phase.L3: value}
+
+
 class MockCharger(Charger):
     """Mock implementation of a Charger for testing."""
 
+    # Push state changes so consumers exercise their cached charge-state path.
+    supports_state_push = True
+
     def __init__(self,
                  initial_current: int = 10,
                  max_current: int = 16,
@@ -21,6 +34,8 @@ class MockCharger(Charger):
         self.hass = None
         self.config_entry = type('ConfigEntry', (), {'entry_id': charger_id})()
         self.device = type('DeviceEntry', (), {'id': device_id})()
+        self.id = charger_id
+        self._state_listeners = []
 
         # Charger state
         self._current_limit = {phase: initial_current for phase in Phase}
@@ -73,18 +88,22 @@ class MockCharger(Charger):
     def set_car_connected(self, connected: bool) -> None:
         """Set whether a car is connected for testing."""
         self._is_car_connected = connected
+        self._notify_state_listeners()
 
     def set_can_charge(self, can_charge: bool) -> None:
         """Set whether the car can charge for testing."""
         self._can_charge_state = can_charge
+        self._notify_state_listeners()
 
     def set_current_limits(self, limits: Dict[Phase, int]) -> None:
         """Manually set the current limits for testing."""
         self._current_limit = limits.copy()
+        self._notify_state_listeners()
 
     def set_max_limits(self, limits: Dict[Phase, int]) -> None:
         """Manually set the max current limits for testing."""
         self._max_current_limit = limits.copy()
+        self._notify_state_listeners()
 
     async def async_setup(self) -> None:
         """Set up the mock charger."""
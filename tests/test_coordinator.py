@@ -52,7 +52,7 @@ def mock_meter():
     # Mock active_phase_current
 
     def get_active_phase_current(phase):
-        return 14 if phase == Phase.L1 else 16
+        return 14 if phase is Phase.L1 else 16
     meter.get_active_phase_current.side_effect = get_active_phase_current
     return meter
 
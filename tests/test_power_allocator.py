@@ -1,10 +1,10 @@
 """Tests for PowerAllocator class."""
 
 import pytest
-from custom_components.evse_load_balancer.power_allocator import ChargerState, PowerAllocator
+from custom_components.evse_load_balancer.power_allocator import ChargerState, PhaseVec, PowerAllocator
 from custom_components.evse_load_balancer.const import Phase
-from .helpers.mock_charger import MockCharger
-from datetime import datetime
+from .helpers.mock_charger import MockCharger, all_phases
+import time
 
 
 @pytest.fixture
@@ -35,12 +35,8 @@ def test_initialize(power_allocator: PowerAllocator):
 
     power_allocator.add_charger_and_initialize(mock_charger)
 
-    assert power_allocator._chargers["charger1"].requested_current == {
-        Phase.L1: 10, Phase.L2: 10, Phase.L3: 10
-    }
-    assert power_allocator._chargers["charger1"].last_applied_current == {
-        Phase.L1: 10, Phase.L2: 10, Phase.L3: 10
-    }
+    assert power_allocator._chargers["charger1"].requested_current == PhaseVec(10, 10, 10)
+    assert power_allocator._chargers["charger1"].last_applied_current == PhaseVec(10, 10, 10)
 
 
 def test_add_charger_and_initialize(power_allocator: PowerAllocator):
@@ -53,12 +49,8 @@ def test_add_charger_and_initialize(power_allocator: PowerAllocator):
     assert "charger1" in power_allocator._chargers
     assert power_allocator._chargers["charger1"].charger == mock_charger
     assert power_allocator._chargers["charger1"].initialized is True
-    assert power_allocator._chargers["charger1"].requested_current == {
-        Phase.L1: 10, Phase.L2: 10, Phase.L3: 10
-    }
-    assert power_allocator._chargers["charger1"].last_applied_current == {
-        Phase.L1: 10, Phase.L2: 10, Phase.L3: 10
-    }
+    assert power_allocator._chargers["charger1"].requested_current == PhaseVec(10, 10, 10)
+    assert power_allocator._chargers["charger1"].last_applied_current == PhaseVec(10, 10, 10)
 
 
 def test_add_charger_already_exists(power_allocator: PowerAllocator):
@@ -133,6 +125,82 @@ def test_update_allocation_overcurrent(power_allocator: PowerAllocator):
     }
 
 
+def test_update_allocation_short_circuits_on_unchanged_inputs(power_allocator: PowerAllocator):
+    """Test that consecutive calls with unchanged inputs reuse the last result."""
+    charger = MockCharger(initial_current=10, charger_id="charger1")
+    charger.set_can_charge(True)
+    power_allocator.add_charger_and_initialize(charger)
+
+    available_currents = {
+        Phase.L1: -8,
+        Phase.L2: -2,
+        Phase.L3: 2
+    }
+
+    first = power_allocator.update_allocation(available_currents)
+    second = power_allocator.update_allocation(available_currents)
+
+    # Identity check: the fast path must return the cached result as-is
+    assert second is first
+
+    # A state change on the charger invalidates the fast path
+    charger.set_current_limits(all_phases(8))
+    third = power_allocator.update_allocation(available_currents)
+    assert third is not first
+
+
+def test_update_allocation_single_phase_deficit(power_allocator: PowerAllocator):
+    """Test that a deficit on one phase only reduces that phase."""
+    charger = MockCharger(
+        initial_current=10, charger_id="charger1", synced_phases=False
+    )
+    charger.set_can_charge(True)
+    power_allocator.add_charger_and_initialize(charger)
+
+    # Overcurrent on L1 only
+    available_currents = {
+        Phase.L1: -8,
+        Phase.L2: 0,
+        Phase.L3: 0
+    }
+
+    result = power_allocator.update_allocation(available_currents)
+
+    assert "charger1" in result
+    assert result["charger1"] == {
+        Phase.L1: 2,
+        Phase.L2: 10,
+        Phase.L3: 10
+    }
+
+
+def test_update_allocation_no_op_after_limits_applied(power_allocator: PowerAllocator):
+    """Test that a second pass with the same inputs yields no redundant updates."""
+    charger = MockCharger(
+        initial_current=10, charger_id="charger1", max_current=16, synced_phases=False
+    )
+    charger.set_can_charge(True)
+    power_allocator.add_charger_and_initialize(charger)
+
+    # Headroom on L1 only, enough to reach the charger's maximum
+    available_currents = {
+        Phase.L1: 8,
+        Phase.L2: 0,
+        Phase.L3: 0
+    }
+
+    first = power_allocator.update_allocation(available_currents)
+    assert first["charger1"][Phase.L1] == 16
+
+    # Mimic the coordinator applying the result to the charger
+    power_allocator.update_applied_current("charger1", first["charger1"])
+    charger.set_current_limits(first["charger1"])
+
+    # The charger already sits on its target, so nothing should be returned
+    second = power_allocator.update_allocation(available_currents)
+    assert second == {}
+
+
 def test_update_allocation_recovery(power_allocator: PowerAllocator):
     """Test update_allocation method with recovery situation."""
     # Create and add a charger that's been reduced
@@ -147,11 +215,7 @@ def test_update_allocation_recovery(power_allocator: PowerAllocator):
     power_allocator.add_charger_and_initialize(charger)
 
     # Make sure the power allocator knows the requested current
-    power_allocator._chargers["charger1"].requested_current = {
-        Phase.L1: 16,
-        Phase.L2: 16,
-        Phase.L3: 16
-    }
+    power_allocator._chargers["charger1"].requested_current = PhaseVec(16, 16, 16)
 
     # Simulate recovery with available capacity
     available_currents = {
@@ -177,21 +241,17 @@ def test_update_applied_current(power_allocator: PowerAllocator):
     charger = MockCharger(initial_current=10, charger_id="charger1")
     power_allocator.add_charger_and_initialize(charger)
 
-    timestamp = datetime.now().timestamp()
+    timestamp = time.monotonic()
     # Simulate application of currents
     power_allocator.update_applied_current(
         "charger1",
-        dict.fromkeys(Phase, 5),
+        all_phases(5),
         timestamp=timestamp
     )
 
     # Verify the applied current
     state = power_allocator._chargers["charger1"]
-    assert state.last_applied_current == {
-        Phase.L1: 5,
-        Phase.L2: 5,
-        Phase.L3: 5
-    }
+    assert state.last_applied_current == PhaseVec(5, 5, 5)
     assert state.last_update_time == timestamp
 
 
@@ -204,8 +264,8 @@ def test_manual_override_detection(power_allocator: PowerAllocator):
     # Simulate application of currents
     power_allocator.update_applied_current(
         "charger1",
-        dict.fromkeys(Phase, 10),
-        timestamp=datetime.now().timestamp()
+        all_phases(10),
+        timestamp=time.monotonic()
     )
 
     # Simulate manual override by changing the limits outside the allocator
@@ -221,11 +281,7 @@ def test_manual_override_detection(power_allocator: PowerAllocator):
 
     assert state.manual_override_detected is True
     # The requested current should be updated to the new values
-    assert state.requested_current == {
-        Phase.L1: 16,
-        Phase.L2: 16,
-        Phase.L3: 16
-    }
+    assert state.requested_current == PhaseVec(16, 16, 16)
 
 
 def test_manual_override_detection_maintains_charger_reset_at_session_start(power_allocator: PowerAllocator):
@@ -241,16 +297,55 @@ def test_manual_override_detection_maintains_charger_reset_at_session_start(powe
     # Detecting manual override after setting charge will take the
     # charger's max current and set it as requested.
     assert state._active_session is False
-    assert state.requested_current == dict.fromkeys(Phase, 10)
+    assert state.requested_current == PhaseVec(10, 10, 10)
 
     charger.set_can_charge(True)  # start charging
 
     # Simulate new currents being applied to the charger from the outside
     state.detect_manual_override()
-    charger.set_current_limits(dict.fromkeys(Phase, 10))
+    charger.set_current_limits(all_phases(10))
 
     assert state._active_session is True
-    assert state.requested_current == dict.fromkeys(Phase, 16)
+    assert state.requested_current == PhaseVec(16, 16, 16)
+
+
+def test_session_start_after_manual_limit_change(power_allocator: PowerAllocator):
+    """Test that a pre-session manual limit change doesn't stall allocation."""
+    charger = MockCharger(initial_current=10, charger_id="charger1", max_current=16)
+    power_allocator.add_charger_and_initialize(charger)
+
+    # User dials the charger down while no car is connected
+    charger.set_current_limits(all_phases(6))
+
+    # A new session starts with headroom available
+    charger.set_can_charge(True)
+    result = power_allocator.update_allocation(all_phases(4))
+
+    # The charger ramps up from its live limits, not the stale last write
+    assert result["charger1"] == all_phases(10)
+    state: ChargerState = power_allocator._chargers["charger1"]
+    assert state.requested_current == PhaseVec(16, 16, 16)
+    assert state.manual_override_detected is False
+
+
+def test_max_limit_cached_per_session(power_allocator: PowerAllocator):
+    """Test that the charger's max limit is read once per charging session."""
+    charger = MockCharger(initial_current=10, charger_id="charger1", max_current=16)
+    power_allocator.add_charger_and_initialize(charger)
+    state: ChargerState = power_allocator._chargers["charger1"]
+
+    charger.set_can_charge(True)
+    state.detect_manual_override()
+    assert state.requested_current == PhaseVec(16, 16, 16)
+
+    # A changed maximum only takes effect once a new session starts
+    charger.set_max_limits(all_phases(32))
+    charger.set_can_charge(False)
+    state.detect_manual_override()
+
+    charger.set_can_charge(True)
+    state.detect_manual_override()
+    assert state.requested_current == PhaseVec(32, 32, 32)
 
 
 def test_multiple_chargers_allocation(power_allocator: PowerAllocator):